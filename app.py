@@ -270,7 +270,9 @@ class App:
                                                     choices=self.whisper_inf.music_separator.available_devices)
                         dd_uvr_model_size = gr.Dropdown(label=_("Model"), value=uvr_params["uvr_model_size"],
                                                         choices=self.whisper_inf.music_separator.available_models)
-                        nb_uvr_segment_size = gr.Number(label="Segment Size", value=uvr_params["segment_size"],
+                        uvr_segment_size = uvr_params.get("segment_size", BGMSeparationParams.get_default_segment_size(
+                            self.whisper_inf.music_separator.device))
+                        nb_uvr_segment_size = gr.Number(label="Segment Size", value=uvr_segment_size,
                                                         precision=0)
                         cb_uvr_save_file = gr.Checkbox(label=_("Save separated files to output"),
                                                        value=True, visible=False)
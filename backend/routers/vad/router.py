@@ -30,6 +30,7 @@ def run_vad(
     audio: np.ndarray,
     params: VadOptions,
     identifier: str,
+    batch_size: int = 1,
 ) -> List[Dict]:
     update_task_status_in_db(
         identifier=identifier,
@@ -43,7 +44,8 @@ def run_vad(
     start_time = datetime.utcnow()
     audio, speech_chunks = get_vad_model().run(
         audio=audio,
-        vad_parameters=params
+        vad_parameters=params,
+        batch_size=batch_size
     )
     elapsed_time = (datetime.utcnow() - start_time).total_seconds()
 
@@ -94,7 +96,8 @@ async def vad(
         task_params=params.model_dump(),
     )
 
-    background_tasks.add_task(run_vad, audio=audio, params=vad_options, identifier=identifier)
+    background_tasks.add_task(run_vad, audio=audio, params=vad_options, identifier=identifier,
+                              batch_size=params.vad_batch_size)
 
     return QueueResponse(identifier=identifier, status=TaskStatus.QUEUED, message="VAD task has queued")
 
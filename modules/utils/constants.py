@@ -4,3 +4,45 @@ AUTOMATIC_DETECTION = _("Automatic Detection")
 GRADIO_NONE_STR = ""
 GRADIO_NONE_NUMBER_MAX = 9999
 GRADIO_NONE_NUMBER_MIN = 0
+
+# Compute types supported by CTranslate2. See more info : https://opennmt.net/CTranslate2/quantization.html
+COMPUTE_TYPES = ("default", "auto", "int8", "int8_float32", "int8_float16", "int8_bfloat16", "int16", "float16",
+                 "bfloat16", "float32")
+COMPUTE_TYPE_ALIASES = {
+    "fp16": "float16",
+    "half": "float16",
+    "bf16": "bfloat16",
+    "fp32": "float32",
+    "float": "float32",
+    "int8float16": "int8_float16",
+    "int8_fp16": "int8_float16",
+    "int8bfloat16": "int8_bfloat16",
+    "int8_bf16": "int8_bfloat16",
+    "int8float32": "int8_float32",
+    "int8_fp32": "int8_float32",
+}
+
+# Float dtype each compute type runs its activations in, for the implementations that aren't CTranslate2 based.
+# "default" and "auto" are resolved by the device.
+COMPUTE_TYPE_FLOAT_DTYPES = {
+    "int8": "float32",
+    "int8_float32": "float32",
+    "int8_float16": "float16",
+    "int8_bfloat16": "bfloat16",
+    "int16": "float32",
+    "float16": "float16",
+    "bfloat16": "bfloat16",
+    "float32": "float32",
+}
+
+# Closest compute types to fall back to, in order, when the device doesn't support the requested one.
+COMPUTE_TYPE_FALLBACKS = {
+    "int8": ("int8_float32", "int8_float16", "float32"),
+    "int8_float32": ("int8", "float32"),
+    "int8_float16": ("int8_float32", "int8", "float16", "float32"),
+    "int8_bfloat16": ("int8_float16", "int8_float32", "int8", "bfloat16", "float16", "float32"),
+    "int16": ("int8_float32", "int8", "float32"),
+    "float16": ("bfloat16", "float32"),
+    "bfloat16": ("float16", "float32"),
+    "float32": ("float16",),
+}
@@ -21,7 +21,8 @@ class SileroVAD:
     def run(self,
             audio: Union[str, BinaryIO, np.ndarray],
             vad_parameters: VadOptions,
-            progress: gr.Progress = gr.Progress()
+            progress: gr.Progress = gr.Progress(),
+            batch_size: int = 1,
             ) -> Tuple[np.ndarray, List[dict]]:
         """
         Run VAD
@@ -34,6 +35,8 @@ class SileroVAD:
             Options for VAD processing.
         progress: gr.Progress
             Indicator to show progress directly in gradio.
+        batch_size: int
+            Number of audio pieces to run through the VAD model at once.
 
         Returns
         ----------
@@ -58,7 +61,8 @@ class SileroVAD:
         speech_chunks = self.get_speech_timestamps(
             audio=audio,
             vad_options=vad_parameters,
-            progress=progress
+            progress=progress,
+            batch_size=batch_size
         )
 
         audio = self.collect_chunks(audio, speech_chunks)
@@ -71,6 +75,7 @@ class SileroVAD:
         audio: np.ndarray,
         vad_options: Optional[VadOptions] = None,
         progress: gr.Progress = gr.Progress(),
+        batch_size: int = 1,
         **kwargs,
     ) -> List[dict]:
         """This method is used for splitting long audios into speech chunks using silero VAD.
@@ -80,6 +85,7 @@ class SileroVAD:
           vad_options: Options for VAD processing.
           kwargs: VAD options passed as keyword arguments for backward compatibility.
           progress: Gradio progress to indicate progress.
+          batch_size: Number of audio pieces to run through the VAD model at once.
 
         Returns:
           List of dicts containing begin and end samples of each speech chunk.
@@ -110,10 +116,7 @@ class SileroVAD:
 
         audio_length_samples = len(audio)
 
-        padded_audio = np.pad(
-            audio, (0, window_size_samples - audio.shape[0] % window_size_samples)
-        )
-        speech_probs = self.model(padded_audio.reshape(1, -1)).squeeze(0)
+        speech_probs = self.get_speech_probs(audio, batch_size=batch_size)
 
         triggered = False
         speeches = []
@@ -209,6 +212,28 @@ class SileroVAD:
 
         return speeches
 
+    def get_speech_probs(self,
+                         audio: np.ndarray,
+                         batch_size: int = 1) -> np.ndarray:
+        """
+        Get speech probabilities for every window of the audio.
+        With `batch_size` > 1, the audio is split into that many pieces which go through the model in a single
+        call, so the decoder steps through fewer windows sequentially. The encoder already runs over all windows
+        at once, so the speedup is modest. Each piece starts from a fresh model state, and the model's state carries
+        over for seconds, so the probabilities and the detected speech boundaries differ from `batch_size` = 1.
+        Overlapping warm-up windows do not reliably remove the difference.
+        """
+        window_size_samples = self.window_size_samples
+        num_windows = audio.shape[0] // window_size_samples + 1
+        batch_size = max(1, min(batch_size, num_windows))
+        windows_per_batch = -(-num_windows // batch_size)
+
+        padded_audio = np.pad(
+            audio, (0, windows_per_batch * batch_size * window_size_samples - audio.shape[0])
+        )
+        speech_probs = self.model(padded_audio.reshape(batch_size, -1)).reshape(-1)
+        return speech_probs[:num_windows]
+
     def update_model(self):
         self.model = get_vad_model()
 
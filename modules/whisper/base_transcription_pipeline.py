@@ -2,9 +2,10 @@ import os
 import whisper
 import ctranslate2
 import gradio as gr
+import torch
 import torchaudio
 from abc import ABC, abstractmethod
-from typing import BinaryIO, Union, Tuple, List
+from typing import BinaryIO, Union, Tuple, List, Optional
 import numpy as np
 from datetime import datetime
 from faster_whisper.vad import VadOptions
@@ -62,6 +63,7 @@ class BaseTranscriptionPipeline(ABC):
                    audio: Union[str, BinaryIO, np.ndarray],
                    progress: gr.Progress = gr.Progress(),
                    *whisper_params,
+                   vad_options: Optional[VadOptions] = None,
                    ):
         """Inference whisper model to transcribe"""
         pass
@@ -143,20 +145,21 @@ class BaseTranscriptionPipeline(ABC):
 
         origin_audio = deepcopy(audio)
 
+        vad_options = VadOptions(
+            threshold=vad_params.threshold,
+            min_speech_duration_ms=vad_params.min_speech_duration_ms,
+            max_speech_duration_s=vad_params.max_speech_duration_s,
+            min_silence_duration_ms=vad_params.min_silence_duration_ms,
+            speech_pad_ms=vad_params.speech_pad_ms
+        )
+
         if vad_params.vad_filter:
             progress(0, desc="Filtering silent parts from audio..")
-            vad_options = VadOptions(
-                threshold=vad_params.threshold,
-                min_speech_duration_ms=vad_params.min_speech_duration_ms,
-                max_speech_duration_s=vad_params.max_speech_duration_s,
-                min_silence_duration_ms=vad_params.min_silence_duration_ms,
-                speech_pad_ms=vad_params.speech_pad_ms
-            )
-
             vad_processed, speech_chunks = self.vad.run(
                 audio=audio,
                 vad_parameters=vad_options,
-                progress=progress
+                progress=progress,
+                batch_size=vad_params.vad_batch_size
             )
 
             if vad_processed.size > 0:
@@ -167,7 +170,8 @@ class BaseTranscriptionPipeline(ABC):
         result, elapsed_time_transcription = self.transcribe(
             audio,
             progress,
-            *whisper_params.to_list()
+            *whisper_params.to_list(),
+            vad_options=vad_options
         )
         if whisper_params.enable_offload:
             self.offload()
@@ -447,6 +451,12 @@ class BaseTranscriptionPipeline(ABC):
         finally:
             self.release_cuda_memory()
 
+    def get_float_compute_type(self, compute_type: str) -> str:
+        """Map a CTranslate2 compute type to the float dtype for the implementations that can't use int8 types"""
+        if compute_type in COMPUTE_TYPE_FLOAT_DTYPES:
+            return COMPUTE_TYPE_FLOAT_DTYPES[compute_type]
+        return "float16" if self.device == "cuda" else "float32"
+
     def get_compute_type(self):
         if "float16" in self.available_compute_types:
             return "float16"
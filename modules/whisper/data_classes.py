@@ -1,7 +1,7 @@
 import faster_whisper.transcribe
 import gradio as gr
-import torch
-from typing import Optional, Dict, List, Union, NamedTuple
+import functools
+from typing import Optional, Dict, List, Union, NamedTuple, ClassVar, Tuple, Type, Any, Iterator
 from fastapi import Query
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 from gradio_i18n import Translate, gettext as _
@@ -19,6 +19,12 @@ class WhisperImpl(Enum):
     INSANELY_FAST_WHISPER = "insanely_fast_whisper"
 
 
+ALL_WHISPER_IMPLS = frozenset(WhisperImpl)
+FASTER_WHISPER_IMPLS = frozenset({WhisperImpl.FASTER_WHISPER})
+BATCHED_WHISPER_IMPLS = frozenset({WhisperImpl.FASTER_WHISPER, WhisperImpl.INSANELY_FAST_WHISPER})
+DEFAULT_COMPUTE_TYPE_CHOICES = ("int8", "int8_float16", "int8_bfloat16", "float16", "bfloat16", "float32")
+
+
 class Segment(BaseModel):
     id: Optional[int] = Field(default=None, description="Incremental id for the segment")
     seek: Optional[int] = Field(default=None, description="Seek of the segment from chunked audio")
@@ -69,26 +75,86 @@ class Word(BaseModel):
     probability: Optional[float] = Field(default=None, description="Probability of the word")
 
 
+GradioSpec = Tuple[Tuple[Type[gr.components.base.FormComponent], Dict[str, Any]], ...]
+
+
+def cached_gradio_spec(builder):
+    """
+    Memoize a classmethod that builds gradio component specs, so rebuilding the UI doesn't re-evaluate every
+    label and default. Arguments that can't be hashed skip the cache.
+    """
+    cached_builder = functools.lru_cache(maxsize=32)(builder)
+
+    @functools.wraps(builder)
+    def wrapper(cls, *args):
+        try:
+            hash(args)
+        except TypeError:
+            return builder(cls, *args)
+        return cached_builder(cls, *args)
+
+    return wrapper
+
+
 class BaseParams(BaseModel):
-    model_config = ConfigDict(protected_namespaces=())
+    model_config = ConfigDict(protected_namespaces=(), extra="forbid")
+    _FIELD_NAMES: ClassVar[Tuple[str, ...]] = ()
+    _FIELD_DEFAULTS: ClassVar[Dict] = {}
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._FIELD_NAMES = tuple(cls.model_fields.keys())
+        cls._FIELD_DEFAULTS = {name: field.get_default(call_default_factory=True)
+                               for name, field in cls.model_fields.items()}
+
+    @staticmethod
+    def freeze_defaults(defaults: Optional[Dict] = None) -> Union[frozenset, tuple]:
+        items = tuple((defaults or {}).items())
+        try:
+            return frozenset(items)
+        except TypeError:
+            # Unhashable values (e.g. lists) are passed through as is and bypass the cache.
+            return items
+
+    @staticmethod
+    def build_gradio_components(spec: GradioSpec) -> List[gr.components.base.FormComponent]:
+        return [component(**kwargs) for component, kwargs in spec]
 
     def to_dict(self) -> Dict:
-        return self.model_dump()
+        values = self.__dict__
+        return {name: values[name] for name in self._FIELD_NAMES}
 
     def to_list(self) -> List:
-        return list(self.model_dump().values())
+        return list(self.iter_values())
+
+    def iter_values(self) -> Iterator:
+        """Yield field values in the field order"""
+        values = self.__dict__
+        return (values[name] for name in self._FIELD_NAMES)
 
     @classmethod
     def from_list(cls, data_list: List) -> 'BaseParams':
-        field_names = list(cls.model_fields.keys())
-        return cls(**dict(zip(field_names, data_list)))
+        return cls(**dict(zip(cls._FIELD_NAMES, data_list)))
+
+    @classmethod
+    def from_form(cls, data_list: Union[List, tuple]) -> 'BaseParams':
+        """
+        Same as `from_list()` but skips validation. Only use it with values from `to_list()` of an already
+        validated instance, e.g. when the pipeline passes the parameters on to `transcribe()`.
+        """
+        return cls.model_construct(**dict(zip(cls._FIELD_NAMES, data_list)))
 
 
 # Models need to be wrapped with Field(Query()) to fix fastapi doc issue.
 # More info : https://github.com/fastapi/fastapi/discussions/8634#discussioncomment-5153136
 class VadParams(BaseParams):
     """Voice Activity Detection parameters"""
-    vad_filter: bool = Field(default=False, description="Enable voice activity detection to filter out non-speech parts")
+    # Silero VAD v5 only accepts a fixed window of 512 samples at 16kHz, which is 32ms.
+    _SILERO_V5_WINDOW_SAMPLES: ClassVar[int] = 512
+    _SILERO_SAMPLING_RATE: ClassVar[int] = 16000
+
+    vad_filter: bool = Field(default=True, description="Enable voice activity detection to filter out non-speech parts")
     threshold: float = Field(
         default=0.5,
         ge=0.0,
@@ -96,9 +162,9 @@ class VadParams(BaseParams):
         description="Speech threshold for Silero VAD. Probabilities above this value are considered speech"
     )
     min_speech_duration_ms: int = Field(
-        default=250,
+        default=256,
         ge=0,
-        description="Final speech chunks shorter than this are discarded"
+        description="Final speech chunks shorter than this are discarded. Rounded to the nearest multiple of 32ms"
     )
     max_speech_duration_s: float = Field(
         default=float("inf"),
@@ -115,42 +181,71 @@ class VadParams(BaseParams):
         ge=0,
         description="Padding added to each side of speech chunks"
     )
+    vad_batch_size: int = Field(
+        default=1,
+        ge=1,
+        description="Number of audio pieces to run through Silero VAD at once. Values above 1 only shorten the "
+                    "sequential decoder pass and change the detected speech, since each piece starts from a fresh "
+                    "model state. Keep 1 unless VAD time matters more than its accuracy"
+    )
+
+    @field_validator('min_speech_duration_ms')
+    def validate_min_speech_duration_ms(cls, v):
+        # Align to the Silero VAD v5 window stride so the last chunk isn't ragged.
+        window_ms = cls._SILERO_V5_WINDOW_SAMPLES * 1000 // cls._SILERO_SAMPLING_RATE
+        if v <= 0:
+            return v
+        # Round half up, and keep at least one window so small values don't turn the filter off.
+        return max(window_ms, (v + window_ms // 2) // window_ms * window_ms)
 
     @classmethod
     def to_gradio_inputs(cls, defaults: Optional[Dict] = None) -> List[gr.components.base.FormComponent]:
-        return [
-            gr.Checkbox(
+        return cls.build_gradio_components(cls.gradio_spec(cls.freeze_defaults(defaults)))
+
+    @classmethod
+    @cached_gradio_spec
+    def gradio_spec(cls, defaults: frozenset) -> GradioSpec:
+        defaults = {**cls._FIELD_DEFAULTS, "max_speech_duration_s": GRADIO_NONE_NUMBER_MAX, **dict(defaults)}
+        return (
+            (gr.Checkbox, dict(
                 label=_("Enable Silero VAD Filter"),
-                value=defaults.get("vad_filter", cls.__fields__["vad_filter"].default),
+                value=defaults["vad_filter"],
                 interactive=True,
-                info=_("Enable this to transcribe only detected voice")
-            ),
-            gr.Slider(
+                info=_("Enable this to transcribe only detected voice. Whisper is skipped on non-speech parts")
+            )),
+            (gr.Slider, dict(
                 minimum=0.0, maximum=1.0, step=0.01, label="Speech Threshold",
-                value=defaults.get("threshold", cls.__fields__["threshold"].default),
+                value=defaults["threshold"],
                 info="Lower it to be more sensitive to small sounds."
-            ),
-            gr.Number(
+            )),
+            (gr.Number, dict(
                 label="Minimum Speech Duration (ms)", precision=0,
-                value=defaults.get("min_speech_duration_ms", cls.__fields__["min_speech_duration_ms"].default),
+                value=defaults["min_speech_duration_ms"],
                 info="Final speech chunks shorter than this time are thrown out"
-            ),
-            gr.Number(
+            )),
+            (gr.Number, dict(
                 label="Maximum Speech Duration (s)",
-                value=defaults.get("max_speech_duration_s", GRADIO_NONE_NUMBER_MAX),
+                value=defaults["max_speech_duration_s"],
                 info="Maximum duration of speech chunks in \"seconds\"."
-            ),
-            gr.Number(
+            )),
+            (gr.Number, dict(
                 label="Minimum Silence Duration (ms)", precision=0,
-                value=defaults.get("min_silence_duration_ms", cls.__fields__["min_silence_duration_ms"].default),
+                value=defaults["min_silence_duration_ms"],
                 info="In the end of each speech chunk wait for this time before separating it"
-            ),
-            gr.Number(
+            )),
+            (gr.Number, dict(
                 label="Speech Padding (ms)", precision=0,
-                value=defaults.get("speech_pad_ms", cls.__fields__["speech_pad_ms"].default),
+                value=defaults["speech_pad_ms"],
                 info="Final speech chunks are padded by this time each side"
-            )
-        ]
+            )),
+            (gr.Number, dict(
+                label="VAD Batch Size", precision=0,
+                value=defaults["vad_batch_size"],
+                info="Number of audio pieces to run through Silero VAD at once. Values above 1 are a bit faster but "
+                     "change the detected speech, since each piece starts from a fresh model state. Keep 1 for "
+                     "accuracy"
+            ))
+        )
 
 
 class DiarizationParams(BaseParams):
@@ -171,26 +266,38 @@ class DiarizationParams(BaseParams):
                          defaults: Optional[Dict] = None,
                          available_devices: Optional[List] = None,
                          device: Optional[str] = None) -> List[gr.components.base.FormComponent]:
-        return [
-            gr.Checkbox(
+        available_devices = None if available_devices is None else tuple(available_devices)
+        return cls.build_gradio_components(
+            cls.gradio_spec(cls.freeze_defaults(defaults), available_devices, device)
+        )
+
+    @classmethod
+    @cached_gradio_spec
+    def gradio_spec(cls,
+                    defaults: frozenset,
+                    available_devices: Optional[tuple] = None,
+                    device: Optional[str] = None) -> GradioSpec:
+        defaults = {**cls._FIELD_DEFAULTS, "device": device, **dict(defaults)}
+        return (
+            (gr.Checkbox, dict(
                 label=_("Enable Diarization"),
-                value=defaults.get("is_diarize", cls.__fields__["is_diarize"].default),
-            ),
-            gr.Dropdown(
+                value=defaults["is_diarize"],
+            )),
+            (gr.Dropdown, dict(
                 label=_("Device"),
-                choices=["cpu", "cuda"] if available_devices is None else available_devices,
-                value=defaults.get("device", device),
-            ),
-            gr.Textbox(
+                choices=["cpu", "cuda"] if available_devices is None else list(available_devices),
+                value=defaults["device"],
+            )),
+            (gr.Textbox, dict(
                 label=_("HuggingFace Token"),
-                value=defaults.get("hf_token", cls.__fields__["hf_token"].default),
+                value=defaults["hf_token"],
                 info=_("This is only needed the first time you download the model")
-            ),
-            gr.Checkbox(
+            )),
+            (gr.Checkbox, dict(
                 label=_("Offload sub model when finished"),
-                value=defaults.get("enable_offload", cls.__fields__["enable_offload"].default),
-            )
-        ]
+                value=defaults["enable_offload"],
+            ))
+        )
 
 
 class BGMSeparationParams(BaseParams):
@@ -202,9 +309,9 @@ class BGMSeparationParams(BaseParams):
     )
     uvr_device: str = Field(default="cuda", description="Device to run UVR model.")
     segment_size: int = Field(
-        default=256,
+        default=128,
         gt=0,
-        description="Segment size for UVR model"
+        description="Segment size for UVR model. Larger segments need more VRAM"
     )
     save_file: bool = Field(
         default=False,
@@ -215,45 +322,73 @@ class BGMSeparationParams(BaseParams):
         description="Offload UVR model after transcription"
     )
 
+    @classmethod
+    def get_default_segment_size(cls, device: Optional[str] = None) -> int:
+        """Use the larger segment size only when the GPU has enough VRAM for it."""
+        import torch
+        if device == "cuda" and torch.cuda.is_available():
+            total_memory = torch.cuda.get_device_properties(0).total_memory
+            return 256 if total_memory > 10e9 else 128
+        return cls._FIELD_DEFAULTS["segment_size"]
+
     @classmethod
     def to_gradio_input(cls,
                         defaults: Optional[Dict] = None,
                         available_devices: Optional[List] = None,
                         device: Optional[str] = None,
                         available_models: Optional[List] = None) -> List[gr.components.base.FormComponent]:
-        return [
-            gr.Checkbox(
+        available_devices = None if available_devices is None else tuple(available_devices)
+        available_models = None if available_models is None else tuple(available_models)
+        return cls.build_gradio_components(
+            cls.gradio_spec(cls.freeze_defaults(defaults), available_devices, device, available_models)
+        )
+
+    @classmethod
+    @cached_gradio_spec
+    def gradio_spec(cls,
+                    defaults: frozenset,
+                    available_devices: Optional[tuple] = None,
+                    device: Optional[str] = None,
+                    available_models: Optional[tuple] = None) -> GradioSpec:
+        defaults = {
+            **cls._FIELD_DEFAULTS,
+            "device": device,
+            "segment_size": cls.get_default_segment_size(device),
+            **dict(defaults)
+        }
+        return (
+            (gr.Checkbox, dict(
                 label=_("Enable Background Music Remover Filter"),
-                value=defaults.get("is_separate_bgm", cls.__fields__["is_separate_bgm"].default),
+                value=defaults["is_separate_bgm"],
                 interactive=True,
                 info=_("Enabling this will remove background music")
-            ),
-            gr.Dropdown(
+            )),
+            (gr.Dropdown, dict(
                 label=_("Model"),
                 choices=["UVR-MDX-NET-Inst_HQ_4",
-                         "UVR-MDX-NET-Inst_3"] if available_models is None else available_models,
-                value=defaults.get("uvr_model_size", cls.__fields__["uvr_model_size"].default),
-            ),
-            gr.Dropdown(
+                         "UVR-MDX-NET-Inst_3"] if available_models is None else list(available_models),
+                value=defaults["uvr_model_size"],
+            )),
+            (gr.Dropdown, dict(
                 label=_("Device"),
-                choices=["cpu", "cuda"] if available_devices is None else available_devices,
-                value=defaults.get("device", device),
-            ),
-            gr.Number(
+                choices=["cpu", "cuda"] if available_devices is None else list(available_devices),
+                value=defaults["device"],
+            )),
+            (gr.Number, dict(
                 label="Segment Size",
-                value=defaults.get("segment_size", cls.__fields__["segment_size"].default),
+                value=defaults["segment_size"],
                 precision=0,
                 info="Segment size for UVR model"
-            ),
-            gr.Checkbox(
+            )),
+            (gr.Checkbox, dict(
                 label=_("Save separated files to output"),
-                value=defaults.get("save_file", cls.__fields__["save_file"].default),
-            ),
-            gr.Checkbox(
+                value=defaults["save_file"],
+            )),
+            (gr.Checkbox, dict(
                 label=_("Offload sub model when finished"),
-                value=defaults.get("enable_offload", cls.__fields__["enable_offload"].default),
-            )
-        ]
+                value=defaults["enable_offload"],
+            ))
+        )
 
 
 class WhisperParams(BaseParams):
@@ -261,7 +396,11 @@ class WhisperParams(BaseParams):
     model_size: str = Field(default="large-v2", description="Whisper model size")
     lang: Optional[str] = Field(default=None, description="Source language of the file to transcribe")
     is_translate: bool = Field(default=False, description="Translate speech to English end-to-end")
-    beam_size: int = Field(default=5, ge=1, description="Beam size for decoding")
+    beam_size: int = Field(
+        default=1,
+        ge=1,
+        description="Beam size for decoding. 1 is greedy decoding, larger values cost proportionally more decode time"
+    )
     log_prob_threshold: float = Field(
         default=-1.0,
         description="Threshold for average log probability of sampled tokens"
@@ -272,8 +411,11 @@ class WhisperParams(BaseParams):
         le=1.0,
         description="Threshold for detecting silence"
     )
-    compute_type: str = Field(default="float16", description="Computation type for transcription")
-    best_of: int = Field(default=5, ge=1, description="Number of candidates when sampling")
+    compute_type: str = Field(
+        default="int8_float16",
+        description="Computation type for transcription. int8 weights with float16 activations by default"
+    )
+    best_of: int = Field(default=1, ge=1, description="Number of candidates when sampling")
     patience: float = Field(default=1.0, gt=0, description="Beam search patience factor")
     condition_on_previous_text: bool = Field(
         default=True,
@@ -336,29 +478,195 @@ class WhisperParams(BaseParams):
         description="Number of segments for language detection"
     )
     batch_size: int = Field(default=24, gt=0, description="Batch size for processing")
+    enable_batched: bool = Field(
+        default=False,
+        description="Use BatchedInferencePipeline to decode multiple chunks at once (faster-whisper). It ignores "
+                    "condition_on_previous_text, prompt_reset_on_temperature, hallucination_silence_threshold and "
+                    "max_initial_timestamp"
+    )
     enable_offload: bool = Field(
         default=True,
         description="Offload Whisper model after transcription"
     )
 
+    # Gradio inputs in the same order as the fields above: (field name, component, kwargs, implementations showing it).
+    # Inputs for other implementations are still created, but hidden, so that the order of the values stays the same.
+    _UI_SPEC: ClassVar[Tuple[Tuple[str, Type[gr.components.base.FormComponent], Dict[str, Any], frozenset], ...]] = (
+        ("model_size", gr.Dropdown, dict(label=_("Model")), ALL_WHISPER_IMPLS),
+        ("lang", gr.Dropdown, dict(label=_("Language")), ALL_WHISPER_IMPLS),
+        ("is_translate", gr.Checkbox, dict(label=_("Translate to English?")), ALL_WHISPER_IMPLS),
+        ("beam_size", gr.Number, dict(
+            label="Beam Size",
+            precision=0,
+            info="Beam size for decoding. Values greater than 1 mostly help long-form accuracy and increase "
+                 "decoding time proportionally"
+        ), ALL_WHISPER_IMPLS),
+        ("log_prob_threshold", gr.Number, dict(
+            label="Log Probability Threshold",
+            info="Threshold for average log probability of sampled tokens"
+        ), ALL_WHISPER_IMPLS),
+        ("no_speech_threshold", gr.Number, dict(
+            label="No Speech Threshold",
+            info="Threshold for detecting silence"
+        ), ALL_WHISPER_IMPLS),
+        ("compute_type", gr.Dropdown, dict(
+            label="Compute Type",
+            info="Computation type for transcription"
+        ), ALL_WHISPER_IMPLS),
+        ("best_of", gr.Number, dict(
+            label="Best Of",
+            precision=0,
+            info="Number of candidates when sampling"
+        ), ALL_WHISPER_IMPLS),
+        ("patience", gr.Number, dict(
+            label="Patience",
+            info="Beam search patience factor"
+        ), ALL_WHISPER_IMPLS),
+        ("condition_on_previous_text", gr.Checkbox, dict(
+            label="Condition On Previous Text",
+            info="Use previous output as prompt for next window"
+        ), ALL_WHISPER_IMPLS),
+        ("prompt_reset_on_temperature", gr.Slider, dict(
+            label="Prompt Reset On Temperature",
+            minimum=0,
+            maximum=1,
+            step=0.01,
+            info="Temperature threshold for resetting prompt"
+        ), ALL_WHISPER_IMPLS),
+        ("initial_prompt", gr.Textbox, dict(
+            label="Initial Prompt",
+            info="Initial prompt for first window"
+        ), ALL_WHISPER_IMPLS),
+        ("temperature", gr.Slider, dict(
+            label="Temperature",
+            minimum=0.0,
+            step=0.01,
+            maximum=1.0,
+            info="Temperature for sampling"
+        ), ALL_WHISPER_IMPLS),
+        ("compression_ratio_threshold", gr.Number, dict(
+            label="Compression Ratio Threshold",
+            info="Threshold for gzip compression ratio"
+        ), ALL_WHISPER_IMPLS),
+        ("length_penalty", gr.Number, dict(
+            label="Length Penalty",
+            info="Exponential length penalty",
+        ), FASTER_WHISPER_IMPLS),
+        ("repetition_penalty", gr.Number, dict(
+            label="Repetition Penalty",
+            info="Penalty for repeated tokens"
+        ), FASTER_WHISPER_IMPLS),
+        ("no_repeat_ngram_size", gr.Number, dict(
+            label="No Repeat N-gram Size",
+            precision=0,
+            info="Size of n-grams to prevent repetition"
+        ), FASTER_WHISPER_IMPLS),
+        ("prefix", gr.Textbox, dict(
+            label="Prefix",
+            info="Prefix text for first window"
+        ), FASTER_WHISPER_IMPLS),
+        ("suppress_blank", gr.Checkbox, dict(
+            label="Suppress Blank",
+            info="Suppress blank outputs at start of sampling"
+        ), FASTER_WHISPER_IMPLS),
+        ("suppress_tokens", gr.Textbox, dict(
+            label="Suppress Tokens",
+            info="Token IDs to suppress"
+        ), FASTER_WHISPER_IMPLS),
+        ("max_initial_timestamp", gr.Number, dict(
+            label="Max Initial Timestamp",
+            info="Maximum initial timestamp"
+        ), FASTER_WHISPER_IMPLS),
+        ("word_timestamps", gr.Checkbox, dict(
+            label="Word Timestamps",
+            info="Extract word-level timestamps"
+        ), FASTER_WHISPER_IMPLS),
+        ("prepend_punctuations", gr.Textbox, dict(
+            label="Prepend Punctuations",
+            info="Punctuations to merge with next word"
+        ), FASTER_WHISPER_IMPLS),
+        ("append_punctuations", gr.Textbox, dict(
+            label="Append Punctuations",
+            info="Punctuations to merge with previous word"
+        ), FASTER_WHISPER_IMPLS),
+        ("max_new_tokens", gr.Number, dict(
+            label="Max New Tokens",
+            precision=0,
+            info="Maximum number of new tokens per chunk"
+        ), FASTER_WHISPER_IMPLS),
+        ("chunk_length", gr.Number, dict(
+            label="Chunk Length (s)",
+            precision=0,
+            info="Length of audio segments in seconds"
+        ), FASTER_WHISPER_IMPLS),
+        ("hallucination_silence_threshold", gr.Number, dict(
+            label="Hallucination Silence Threshold (sec)",
+            info="Threshold for skipping silent periods in hallucination detection"
+        ), FASTER_WHISPER_IMPLS),
+        ("hotwords", gr.Textbox, dict(
+            label="Hotwords",
+            info="Hotwords/hint phrases for the model"
+        ), FASTER_WHISPER_IMPLS),
+        ("language_detection_threshold", gr.Number, dict(
+            label="Language Detection Threshold",
+            info="Threshold for language detection probability"
+        ), FASTER_WHISPER_IMPLS),
+        ("language_detection_segments", gr.Number, dict(
+            label="Language Detection Segments",
+            precision=0,
+            info="Number of segments for language detection"
+        ), FASTER_WHISPER_IMPLS),
+        ("batch_size", gr.Number, dict(
+            label="Batch Size",
+            precision=0,
+            info="Batch size for processing"
+        ), BATCHED_WHISPER_IMPLS),
+        ("enable_batched", gr.Checkbox, dict(
+            label="Enable Batched Inference",
+            info="Decode multiple chunks of the audio at once with BatchedInferencePipeline. It ignores Condition On "
+                 "Previous Text, Prompt Reset On Temperature, Hallucination Silence Threshold and Max Initial "
+                 "Timestamp"
+        ), FASTER_WHISPER_IMPLS),
+        ("enable_offload", gr.Checkbox, dict(label=_("Offload sub model when finished")), ALL_WHISPER_IMPLS),
+    )
+    # Inputs that are created outside the "Advanced Parameters" accordion in the app
+    _UI_BASIC_FIELDS: ClassVar[Tuple[str, ...]] = ("model_size", "lang", "is_translate")
+
     @field_validator('lang')
     def validate_lang(cls, v):
         from modules.utils.constants import AUTOMATIC_DETECTION
         return None if v == AUTOMATIC_DETECTION.unwrap() else v
 
-    @field_validator('suppress_tokens')
+    @field_validator('compute_type')
+    def validate_compute_type(cls, v):
+        compute_type = v.strip().lower().replace("-", "_")
+        compute_type = COMPUTE_TYPE_ALIASES.get(compute_type, compute_type)
+        if compute_type in COMPUTE_TYPES:
+            return compute_type
+        # Fall back to the closest family for unknown values
+        if compute_type.startswith("int"):
+            return "int8"
+        if "bf" in compute_type:
+            return "bfloat16"
+        if compute_type.startswith(("float", "fp")):
+            return "float32"
+        return "auto"
+
+    @field_validator('suppress_tokens', mode="before")
     def validate_supress_tokens(cls, v):
+        # Parsed once here, so the inference doesn't have to deal with the string from the UI.
         import ast
+        if v is None:
+            return v
         try:
-            if isinstance(v, str):
-                suppress_tokens = ast.literal_eval(v)
-                if not isinstance(suppress_tokens, list):
-                    raise ValueError("Invalid Suppress Tokens. The value must be type of List[int]")
-                return suppress_tokens
-            if isinstance(v, list):
-                return v
-        except Exception as e:
+            suppress_tokens = ast.literal_eval(v) if isinstance(v, str) else v
+        except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError) as e:
             raise ValueError(f"Invalid Suppress Tokens. The value must be type of List[int]: {e}")
+        # bool is a subclass of int, but True/False are not token ids
+        if not isinstance(suppress_tokens, list) or \
+                not all(isinstance(t, int) and not isinstance(t, bool) for t in suppress_tokens):
+            raise ValueError("Invalid Suppress Tokens. The value must be type of List[int]")
+        return suppress_tokens
 
     @classmethod
     def to_gradio_inputs(cls,
@@ -370,212 +678,58 @@ class WhisperParams(BaseParams):
                          available_compute_types: Optional[List] = None,
                          compute_type: Optional[str] = None):
         whisper_type = WhisperImpl.FASTER_WHISPER.value if whisper_type is None else whisper_type.strip().lower()
+        available_models = None if available_models is None else tuple(available_models)
+        available_langs = None if available_langs is None else tuple(available_langs)
+        available_compute_types = None if available_compute_types is None else tuple(available_compute_types)
 
-        inputs = []
-        if not only_advanced:
-            inputs += [
-                gr.Dropdown(
-                    label=_("Model"),
-                    choices=available_models,
-                    value=defaults.get("model_size", cls.__fields__["model_size"].default),
-                ),
-                gr.Dropdown(
-                    label=_("Language"),
-                    choices=available_langs,
-                    value=defaults.get("lang", AUTOMATIC_DETECTION),
-                ),
-                gr.Checkbox(
-                    label=_("Translate to English?"),
-                    value=defaults.get("is_translate", cls.__fields__["is_translate"].default),
-                ),
-            ]
-
-        inputs += [
-            gr.Number(
-                label="Beam Size",
-                value=defaults.get("beam_size", cls.__fields__["beam_size"].default),
-                precision=0,
-                info="Beam size for decoding"
-            ),
-            gr.Number(
-                label="Log Probability Threshold",
-                value=defaults.get("log_prob_threshold", cls.__fields__["log_prob_threshold"].default),
-                info="Threshold for average log probability of sampled tokens"
-            ),
-            gr.Number(
-                label="No Speech Threshold",
-                value=defaults.get("no_speech_threshold", cls.__fields__["no_speech_threshold"].default),
-                info="Threshold for detecting silence"
-            ),
-            gr.Dropdown(
-                label="Compute Type",
-                choices=["float16", "int8", "int16"] if available_compute_types is None else available_compute_types,
-                value=defaults.get("compute_type", compute_type),
-                info="Computation type for transcription"
-            ),
-            gr.Number(
-                label="Best Of",
-                value=defaults.get("best_of", cls.__fields__["best_of"].default),
-                precision=0,
-                info="Number of candidates when sampling"
-            ),
-            gr.Number(
-                label="Patience",
-                value=defaults.get("patience", cls.__fields__["patience"].default),
-                info="Beam search patience factor"
-            ),
-            gr.Checkbox(
-                label="Condition On Previous Text",
-                value=defaults.get("condition_on_previous_text", cls.__fields__["condition_on_previous_text"].default),
-                info="Use previous output as prompt for next window"
-            ),
-            gr.Slider(
-                label="Prompt Reset On Temperature",
-                value=defaults.get("prompt_reset_on_temperature",
-                                   cls.__fields__["prompt_reset_on_temperature"].default),
-                minimum=0,
-                maximum=1,
-                step=0.01,
-                info="Temperature threshold for resetting prompt"
-            ),
-            gr.Textbox(
-                label="Initial Prompt",
-                value=defaults.get("initial_prompt", GRADIO_NONE_STR),
-                info="Initial prompt for first window"
-            ),
-            gr.Slider(
-                label="Temperature",
-                value=defaults.get("temperature", cls.__fields__["temperature"].default),
-                minimum=0.0,
-                step=0.01,
-                maximum=1.0,
-                info="Temperature for sampling"
-            ),
-            gr.Number(
-                label="Compression Ratio Threshold",
-                value=defaults.get("compression_ratio_threshold",
-                                   cls.__fields__["compression_ratio_threshold"].default),
-                info="Threshold for gzip compression ratio"
-            )
-        ]
-
-        faster_whisper_inputs = [
-            gr.Number(
-                label="Length Penalty",
-                value=defaults.get("length_penalty", cls.__fields__["length_penalty"].default),
-                info="Exponential length penalty",
-            ),
-            gr.Number(
-                label="Repetition Penalty",
-                value=defaults.get("repetition_penalty", cls.__fields__["repetition_penalty"].default),
-                info="Penalty for repeated tokens"
-            ),
-            gr.Number(
-                label="No Repeat N-gram Size",
-                value=defaults.get("no_repeat_ngram_size", cls.__fields__["no_repeat_ngram_size"].default),
-                precision=0,
-                info="Size of n-grams to prevent repetition"
-            ),
-            gr.Textbox(
-                label="Prefix",
-                value=defaults.get("prefix", GRADIO_NONE_STR),
-                info="Prefix text for first window"
-            ),
-            gr.Checkbox(
-                label="Suppress Blank",
-                value=defaults.get("suppress_blank", cls.__fields__["suppress_blank"].default),
-                info="Suppress blank outputs at start of sampling"
-            ),
-            gr.Textbox(
-                label="Suppress Tokens",
-                value=defaults.get("suppress_tokens", "[-1]"),
-                info="Token IDs to suppress"
-            ),
-            gr.Number(
-                label="Max Initial Timestamp",
-                value=defaults.get("max_initial_timestamp", cls.__fields__["max_initial_timestamp"].default),
-                info="Maximum initial timestamp"
-            ),
-            gr.Checkbox(
-                label="Word Timestamps",
-                value=defaults.get("word_timestamps", cls.__fields__["word_timestamps"].default),
-                info="Extract word-level timestamps"
-            ),
-            gr.Textbox(
-                label="Prepend Punctuations",
-                value=defaults.get("prepend_punctuations", cls.__fields__["prepend_punctuations"].default),
-                info="Punctuations to merge with next word"
-            ),
-            gr.Textbox(
-                label="Append Punctuations",
-                value=defaults.get("append_punctuations", cls.__fields__["append_punctuations"].default),
-                info="Punctuations to merge with previous word"
-            ),
-            gr.Number(
-                label="Max New Tokens",
-                value=defaults.get("max_new_tokens", GRADIO_NONE_NUMBER_MIN),
-                precision=0,
-                info="Maximum number of new tokens per chunk"
-            ),
-            gr.Number(
-                label="Chunk Length (s)",
-                value=defaults.get("chunk_length", cls.__fields__["chunk_length"].default),
-                precision=0,
-                info="Length of audio segments in seconds"
-            ),
-            gr.Number(
-                label="Hallucination Silence Threshold (sec)",
-                value=defaults.get("hallucination_silence_threshold",
-                                   GRADIO_NONE_NUMBER_MIN),
-                info="Threshold for skipping silent periods in hallucination detection"
-            ),
-            gr.Textbox(
-                label="Hotwords",
-                value=defaults.get("hotwords", cls.__fields__["hotwords"].default),
-                info="Hotwords/hint phrases for the model"
-            ),
-            gr.Number(
-                label="Language Detection Threshold",
-                value=defaults.get("language_detection_threshold",
-                                   GRADIO_NONE_NUMBER_MIN),
-                info="Threshold for language detection probability"
-            ),
-            gr.Number(
-                label="Language Detection Segments",
-                value=defaults.get("language_detection_segments",
-                                   cls.__fields__["language_detection_segments"].default),
-                precision=0,
-                info="Number of segments for language detection"
-            )
-        ]
-
-        insanely_fast_whisper_inputs = [
-            gr.Number(
-                label="Batch Size",
-                value=defaults.get("batch_size", cls.__fields__["batch_size"].default),
-                precision=0,
-                info="Batch size for processing"
-            )
-        ]
-
-        if whisper_type != WhisperImpl.FASTER_WHISPER.value:
-            for input_component in faster_whisper_inputs:
-                input_component.visible = False
-
-        if whisper_type != WhisperImpl.INSANELY_FAST_WHISPER.value:
-            for input_component in insanely_fast_whisper_inputs:
-                input_component.visible = False
+        return cls.build_gradio_components(
+            cls.gradio_spec(cls.freeze_defaults(defaults), only_advanced, whisper_type, available_models,
+                            available_langs, available_compute_types, compute_type)
+        )
 
-        inputs += faster_whisper_inputs + insanely_fast_whisper_inputs
+    @classmethod
+    @cached_gradio_spec
+    def gradio_spec(cls,
+                    defaults: frozenset,
+                    only_advanced: Optional[bool] = True,
+                    whisper_type: Optional[str] = None,
+                    available_models: Optional[tuple] = None,
+                    available_langs: Optional[tuple] = None,
+                    available_compute_types: Optional[tuple] = None,
+                    compute_type: Optional[str] = None) -> GradioSpec:
+        defaults = {
+            **cls._FIELD_DEFAULTS,
+            "lang": AUTOMATIC_DETECTION,
+            "compute_type": compute_type,
+            "initial_prompt": GRADIO_NONE_STR,
+            "prefix": GRADIO_NONE_STR,
+            "suppress_tokens": "[-1]",
+            "max_new_tokens": GRADIO_NONE_NUMBER_MIN,
+            "hallucination_silence_threshold": GRADIO_NONE_NUMBER_MIN,
+            "language_detection_threshold": GRADIO_NONE_NUMBER_MIN,
+            **dict(defaults)
+        }
 
-        inputs += [
-            gr.Checkbox(
-                label=_("Offload sub model when finished"),
-                value=defaults.get("enable_offload", cls.__fields__["enable_offload"].default),
-            )
-        ]
+        choices = {
+            "model_size": None if available_models is None else list(available_models),
+            "lang": None if available_langs is None else list(available_langs),
+            "compute_type": list(DEFAULT_COMPUTE_TYPE_CHOICES) if available_compute_types is None
+            else list(available_compute_types),
+        }
+        # Unknown types fall back to faster-whisper, same as in WhisperFactory
+        whisper_impl = next((impl for impl in WhisperImpl if impl.value == whisper_type), WhisperImpl.FASTER_WHISPER)
 
-        return inputs
+        inputs = []
+        for name, component, kwargs, impls in cls._UI_SPEC:
+            if only_advanced and name in cls._UI_BASIC_FIELDS:
+                continue
+            kwargs = {**kwargs, "value": defaults[name]}
+            if name in choices:
+                kwargs["choices"] = choices[name]
+            if whisper_impl not in impls:
+                kwargs["visible"] = False
+            inputs.append((component, kwargs))
+        return tuple(inputs)
 
 
 class TranscriptionPipelineParams(BaseModel):
@@ -600,27 +754,28 @@ class TranscriptionPipelineParams(BaseModel):
         Related Gradio issue: https://github.com/gradio-app/gradio/issues/2471
         See more about Gradio pre-processing: https://www.gradio.app/docs/components
         """
-        whisper_list = self.whisper.to_list()
-        vad_list = self.vad.to_list()
-        diarization_list = self.diarization.to_list()
-        bgm_sep_list = self.bgm_separation.to_list()
-        return whisper_list + vad_list + diarization_list + bgm_sep_list
+        return [
+            *self.whisper.iter_values(),
+            *self.vad.iter_values(),
+            *self.diarization.iter_values(),
+            *self.bgm_separation.iter_values()
+        ]
 
     @staticmethod
     def from_list(pipeline_list: List) -> 'TranscriptionPipelineParams':
         """Convert list to the data class again to use it in a function."""
         data_list = deepcopy(pipeline_list)
 
-        whisper_list = data_list[0:len(WhisperParams.__annotations__)]
-        data_list = data_list[len(WhisperParams.__annotations__):]
+        whisper_list = data_list[0:len(WhisperParams._FIELD_NAMES)]
+        data_list = data_list[len(WhisperParams._FIELD_NAMES):]
 
-        vad_list = data_list[0:len(VadParams.__annotations__)]
-        data_list = data_list[len(VadParams.__annotations__):]
+        vad_list = data_list[0:len(VadParams._FIELD_NAMES)]
+        data_list = data_list[len(VadParams._FIELD_NAMES):]
 
-        diarization_list = data_list[0:len(DiarizationParams.__annotations__)]
-        data_list = data_list[len(DiarizationParams.__annotations__):]
+        diarization_list = data_list[0:len(DiarizationParams._FIELD_NAMES)]
+        data_list = data_list[len(DiarizationParams._FIELD_NAMES):]
 
-        bgm_sep_list = data_list[0:len(BGMSeparationParams.__annotations__)]
+        bgm_sep_list = data_list[0:len(BGMSeparationParams._FIELD_NAMES)]
 
         return TranscriptionPipelineParams(
             whisper=WhisperParams.from_list(whisper_list),
@@ -3,9 +3,10 @@ import time
 import huggingface_hub
 import numpy as np
 import torch
-from typing import BinaryIO, Union, Tuple, List
+from typing import BinaryIO, Union, Tuple, List, Optional
 import faster_whisper
-from faster_whisper.vad import VadOptions
+from faster_whisper.vad import VadOptions, get_speech_timestamps, merge_segments
+from dataclasses import replace
 import ast
 import ctranslate2
 import whisper
@@ -13,6 +14,7 @@ import gradio as gr
 from argparse import Namespace
 
 from modules.utils.paths import (FASTER_WHISPER_MODELS_DIR, DIARIZATION_MODELS_DIR, UVR_MODELS_DIR, OUTPUT_DIR)
+from modules.utils.constants import COMPUTE_TYPE_FALLBACKS
 from modules.whisper.data_classes import *
 from modules.whisper.base_transcription_pipeline import BaseTranscriptionPipeline
 
@@ -41,6 +43,7 @@ class FasterWhisperInference(BaseTranscriptionPipeline):
                    audio: Union[str, BinaryIO, np.ndarray],
                    progress: gr.Progress = gr.Progress(),
                    *whisper_params,
+                   vad_options: Optional[VadOptions] = None,
                    ) -> Tuple[List[Segment], float]:
         """
         transcribe method for faster-whisper.
@@ -53,6 +56,8 @@ class FasterWhisperInference(BaseTranscriptionPipeline):
             Indicator to show progress directly in gradio.
         *whisper_params: tuple
             Parameters related with whisper. This will be dealt with "WhisperParameters" data class
+        vad_options: Optional[VadOptions]
+            VAD options of the pipeline. Used by faster-whisper to split the audio for batched inference.
 
         Returns
         ----------
@@ -63,12 +68,38 @@ class FasterWhisperInference(BaseTranscriptionPipeline):
         """
         start_time = time.time()
 
-        params = WhisperParams.from_list(list(whisper_params))
+        params = WhisperParams.from_form(whisper_params)
 
         if params.model_size != self.current_model_size or self.model is None or self.current_compute_type != params.compute_type:
             self.update_model(params.model_size, params.compute_type, progress)
 
-        segments, info = self.model.transcribe(
+        model = self.model
+        batch_kwargs = {}
+        if params.enable_batched:
+            feature_extractor = self.model.feature_extractor
+            if not isinstance(audio, np.ndarray):
+                audio = faster_whisper.decode_audio(audio, sampling_rate=feature_extractor.sampling_rate)
+            # Each chunk is padded or trimmed to the model's 30 seconds window, so longer chunks would lose their end
+            chunk_length = min(params.chunk_length or feature_extractor.chunk_length, feature_extractor.chunk_length)
+            clip_timestamps = self.get_batched_clip_timestamps(
+                audio=audio,
+                chunk_length=chunk_length,
+                vad_options=vad_options,
+                sampling_rate=feature_extractor.sampling_rate
+            )
+            if not clip_timestamps:
+                return [], time.time() - start_time
+
+            model = faster_whisper.BatchedInferencePipeline(model=self.model)
+            # Pass the chunks explicitly, otherwise the pipeline runs its own VAD with hard-coded options
+            batch_kwargs = {
+                "batch_size": params.batch_size,
+                "vad_filter": False,
+                "clip_timestamps": clip_timestamps,
+                "without_timestamps": False,
+            }
+
+        segments, info = model.transcribe(
             audio=audio,
             language=params.lang,
             task="translate" if params.is_translate else "transcribe",
@@ -97,6 +128,7 @@ class FasterWhisperInference(BaseTranscriptionPipeline):
             language_detection_threshold=params.language_detection_threshold,
             language_detection_segments=params.language_detection_segments,
             prompt_reset_on_temperature=params.prompt_reset_on_temperature,
+            **batch_kwargs
         )
         progress(0, desc="Loading audio..")
 
@@ -150,11 +182,15 @@ class FasterWhisperInference(BaseTranscriptionPipeline):
             local_files_only = True
 
         self.current_compute_type = compute_type
+        supported_compute_type = self.get_supported_compute_type(compute_type, self.available_compute_types)
+        if supported_compute_type != compute_type:
+            print(f"Compute type \"{compute_type}\" is not supported on this device. "
+                  f"Using \"{supported_compute_type}\" instead.")
         self.model = faster_whisper.WhisperModel(
             device=self.device,
             model_size_or_path=self.current_model_size,
             download_root=self.model_dir,
-            compute_type=self.current_compute_type,
+            compute_type=supported_compute_type,
             local_files_only=local_files_only
         )
 
@@ -188,6 +224,33 @@ class FasterWhisperInference(BaseTranscriptionPipeline):
         else:
             return "auto"
 
+    @staticmethod
+    def get_supported_compute_type(compute_type: str,
+                                   available_compute_types: List[str]) -> str:
+        """
+        Resolve the compute type to the closest one in `available_compute_types`, because CTranslate2 raises an
+        error instead of falling back when the device doesn't support the requested compute type.
+        """
+        if compute_type in ("default", "auto") or compute_type in available_compute_types:
+            return compute_type
+        for fallback in COMPUTE_TYPE_FALLBACKS.get(compute_type, ()):
+            if fallback in available_compute_types:
+                return fallback
+        return "auto"
+
+    @staticmethod
+    def get_batched_clip_timestamps(audio: np.ndarray,
+                                    chunk_length: int,
+                                    vad_options: Optional[VadOptions] = None,
+                                    sampling_rate: int = 16000) -> List[dict]:
+        """
+        Split the audio at speech boundaries into chunks of at most `chunk_length` seconds for
+        BatchedInferencePipeline, so that no chunk starts or ends in the middle of an utterance.
+        """
+        vad_options = replace(vad_options or VadOptions(), max_speech_duration_s=chunk_length)
+        speech_chunks = get_speech_timestamps(audio, vad_options=vad_options, sampling_rate=sampling_rate)
+        return merge_segments(speech_chunks, vad_options, sampling_rate=sampling_rate)
+
     @staticmethod
     def format_suppress_tokens_str(suppress_tokens_str: str) -> List[int]:
         try:
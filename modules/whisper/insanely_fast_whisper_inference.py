@@ -1,7 +1,8 @@
 import os
 import time
 import numpy as np
-from typing import BinaryIO, Union, Tuple, List
+from typing import BinaryIO, Union, Tuple, List, Optional
+from faster_whisper.vad import VadOptions
 import torch
 from transformers import pipeline
 from transformers.utils import is_flash_attn_2_available
@@ -38,6 +39,7 @@ class InsanelyFastWhisperInference(BaseTranscriptionPipeline):
                    audio: Union[str, np.ndarray, torch.Tensor],
                    progress: gr.Progress = gr.Progress(),
                    *whisper_params,
+                   vad_options: Optional[VadOptions] = None,
                    ) -> Tuple[List[Segment], float]:
         """
         transcribe method for faster-whisper.
@@ -50,6 +52,8 @@ class InsanelyFastWhisperInference(BaseTranscriptionPipeline):
             Indicator to show progress directly in gradio.
         *whisper_params: tuple
             Parameters related with whisper. This will be dealt with "WhisperParameters" data class
+        vad_options: Optional[VadOptions]
+            VAD options of the pipeline. Used by faster-whisper to split the audio for batched inference.
 
         Returns
         ----------
@@ -59,7 +63,7 @@ class InsanelyFastWhisperInference(BaseTranscriptionPipeline):
             elapsed time for transcription
         """
         start_time = time.time()
-        params = WhisperParams.from_list(list(whisper_params))
+        params = WhisperParams.from_form(whisper_params)
 
         if params.model_size != self.current_model_size or self.model is None or self.current_compute_type != params.compute_type:
             self.update_model(params.model_size, params.compute_type, progress)
@@ -139,7 +143,7 @@ class InsanelyFastWhisperInference(BaseTranscriptionPipeline):
         self.model = pipeline(
             "automatic-speech-recognition",
             model=os.path.join(self.model_dir, model_size),
-            torch_dtype=self.current_compute_type,
+            torch_dtype=self.get_float_compute_type(self.current_compute_type),
             device=self.device,
             model_kwargs={"attn_implementation": "flash_attention_2"} if is_flash_attn_2_available() else {"attn_implementation": "sdpa"},
         )
@@ -1,7 +1,8 @@
 import whisper
 import gradio as gr
 import time
-from typing import BinaryIO, Union, Tuple, List
+from typing import BinaryIO, Union, Tuple, List, Optional
+from faster_whisper.vad import VadOptions
 import numpy as np
 import torch
 import os
@@ -30,6 +31,7 @@ class WhisperInference(BaseTranscriptionPipeline):
                    audio: Union[str, np.ndarray, torch.Tensor],
                    progress: gr.Progress = gr.Progress(),
                    *whisper_params,
+                   vad_options: Optional[VadOptions] = None,
                    ) -> Tuple[List[Segment], float]:
         """
         transcribe method for faster-whisper.
@@ -42,6 +44,8 @@ class WhisperInference(BaseTranscriptionPipeline):
             Indicator to show progress directly in gradio.
         *whisper_params: tuple
             Parameters related with whisper. This will be dealt with "WhisperParameters" data class
+        vad_options: Optional[VadOptions]
+            VAD options of the pipeline. Used by faster-whisper to split the audio for batched inference.
 
         Returns
         ----------
@@ -51,7 +55,7 @@ class WhisperInference(BaseTranscriptionPipeline):
             elapsed time for transcription
         """
         start_time = time.time()
-        params = WhisperParams.from_list(list(whisper_params))
+        params = WhisperParams.from_form(whisper_params)
 
         if params.model_size != self.current_model_size or self.model is None or self.current_compute_type != params.compute_type:
             self.update_model(params.model_size, params.compute_type, progress)
@@ -66,7 +70,7 @@ class WhisperInference(BaseTranscriptionPipeline):
                                        logprob_threshold=params.log_prob_threshold,
                                        no_speech_threshold=params.no_speech_threshold,
                                        task="translate" if params.is_translate else "transcribe",
-                                       fp16=True if params.compute_type == "float16" else False,
+                                       fp16=self.get_float_compute_type(params.compute_type) == "float16",
                                        best_of=params.best_of,
                                        patience=params.patience,
                                        temperature=params.temperature,
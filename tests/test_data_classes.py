@@ -0,0 +1,46 @@
+import pytest
+from pydantic import ValidationError
+
+from modules.whisper.data_classes import *
+
+
+def test_pipeline_params_to_list():
+    params = TranscriptionPipelineParams(
+        whisper=WhisperParams(beam_size=3),
+        vad=VadParams(threshold=0.3),
+        diarization=DiarizationParams(is_diarize=True, hf_token="test"),
+        bgm_separation=BGMSeparationParams(segment_size=64),
+    )
+    params_list = params.to_list()
+
+    param_classes = (WhisperParams, VadParams, DiarizationParams, BGMSeparationParams)
+    assert len(params_list) == sum(len(cls.model_fields) for cls in param_classes)
+    assert params_list == (params.whisper.to_list() + params.vad.to_list() + params.diarization.to_list() +
+                           params.bgm_separation.to_list())
+    assert TranscriptionPipelineParams.from_list(params_list) == params
+
+
+def test_vad_min_speech_duration_alignment():
+    aligned = [VadParams(min_speech_duration_ms=value).min_speech_duration_ms for value in (0, 1, 15, 16, 48, 250)]
+    assert aligned == [0, 32, 32, 32, 64, 256]
+
+
+def test_whisper_compute_type_normalization():
+    compute_types = [WhisperParams(compute_type=value).compute_type
+                     for value in ("int8_float16", "INT8-FP16", "fp16", "int4", "bf8", "float64", "unknown")]
+    assert compute_types == ["int8_float16", "int8_float16", "float16", "int8", "bfloat16", "float32", "auto"]
+
+
+@pytest.mark.parametrize(
+    "suppress_tokens",
+    ["[1, 'a']", "5", "(1, 2)", "{[1]: 2}", "[True]", [True], "[1,", "a"]
+)
+def test_whisper_invalid_suppress_tokens(suppress_tokens):
+    with pytest.raises(ValidationError):
+        WhisperParams(suppress_tokens=suppress_tokens)
+
+
+def test_whisper_suppress_tokens_parsing():
+    assert WhisperParams(suppress_tokens="[-1, 50257]").suppress_tokens == [-1, 50257]
+    assert WhisperParams(suppress_tokens=[-1]).suppress_tokens == [-1]
+    assert WhisperParams(suppress_tokens=None).suppress_tokens is None
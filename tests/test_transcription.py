@@ -1,4 +1,5 @@
 from modules.whisper.whisper_factory import WhisperFactory
+from modules.whisper.faster_whisper_inference import FasterWhisperInference
 from modules.whisper.data_classes import *
 from modules.utils.subtitle_manager import read_file
 from modules.utils.paths import WEBUI_DIR
@@ -7,7 +8,10 @@ from test_config import *
 import requests
 import pytest
 import gradio as gr
+import numpy as np
 import os
+import faster_whisper
+from faster_whisper.vad import VadOptions
 
 
 @pytest.mark.parametrize(
@@ -92,3 +96,55 @@ def test_transcribe(
     assert wer < 0.1, f"WER is too high, it's {wer}"
 
 
+
+
+@pytest.mark.parametrize(
+    "chunk_length",
+    [10, 30]
+)
+def test_batched_clip_timestamps(
+    chunk_length: int
+):
+    download_file()
+    sampling_rate = 16000
+    audio = np.concatenate([faster_whisper.decode_audio(TEST_FILE_PATH, sampling_rate=sampling_rate)] * 4)
+
+    clip_timestamps = FasterWhisperInference.get_batched_clip_timestamps(
+        audio=audio,
+        chunk_length=chunk_length,
+        vad_options=VadOptions(min_silence_duration_ms=160),
+        sampling_rate=sampling_rate
+    )
+    speech_chunks = faster_whisper.vad.get_speech_timestamps(audio, VadOptions(min_silence_duration_ms=160))
+
+    assert len(clip_timestamps) > 1
+    prev_end = 0
+    for chunk in clip_timestamps:
+        assert prev_end <= chunk["start"] < chunk["end"] <= len(audio)
+        assert chunk["end"] - chunk["start"] <= chunk_length * sampling_rate
+        prev_end = chunk["end"]
+    # Chunks are cut in silences, so no detected speech that fits in a chunk crosses a chunk boundary
+    for speech in speech_chunks:
+        if speech["end"] - speech["start"] > chunk_length * sampling_rate:
+            continue
+        assert any(chunk["start"] <= speech["start"] and speech["end"] <= chunk["end"] for chunk in clip_timestamps)
+
+
+@pytest.mark.parametrize(
+    "compute_type,available_compute_types,expected",
+    [
+        ("int8_float16", ["int8_float32", "int8", "float32", "int16"], "int8_float32"),
+        ("int8_float16", ["int8", "float32"], "int8"),
+        ("int8_bfloat16", ["int8_float16", "int8", "float16", "float32"], "int8_float16"),
+        ("bfloat16", ["int8", "float16", "float32"], "float16"),
+        ("float16", ["int8_float32", "int8", "float32", "int16"], "float32"),
+        ("int8_float16", ["int8_float16", "float16", "float32"], "int8_float16"),
+        ("auto", ["int8", "float32"], "auto"),
+    ]
+)
+def test_supported_compute_type(
+    compute_type: str,
+    available_compute_types: list,
+    expected: str
+):
+    assert FasterWhisperInference.get_supported_compute_type(compute_type, available_compute_types) == expected
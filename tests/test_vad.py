@@ -1,6 +1,7 @@
 import gradio as gr
 import pytest
 import os
+import numpy as np
 
 from modules.whisper.data_classes import *
 from modules.vad.silero_vad import SileroVAD
@@ -56,3 +57,25 @@ def test_vad(
     )
 
     assert speech_chunks
+
+
+@pytest.mark.parametrize(
+    "batch_size",
+    [1, 4, 1000]
+)
+def test_vad_speech_probs_batch_size(
+    batch_size: int
+):
+    vad_model = SileroVAD()
+    vad_model.update_model()
+
+    window_size_samples = vad_model.window_size_samples
+    audio = np.random.default_rng(0).uniform(-0.5, 0.5, 37 * window_size_samples + 100).astype(np.float32)
+
+    speech_probs = vad_model.get_speech_probs(audio, batch_size=batch_size)
+
+    assert speech_probs.shape == (len(audio) // window_size_samples + 1,)
+    if batch_size == 1:
+        padded_audio = np.pad(audio, (0, window_size_samples - audio.shape[0] % window_size_samples))
+        expected_probs = vad_model.model(padded_audio.reshape(1, -1)).squeeze(0)
+        np.testing.assert_array_equal(speech_probs, expected_probs.reshape(-1))